@@ -1,39 +1,46 @@
 
-import re
 import sys
+from bs4 import BeautifulSoup, SoupStrainer
+
+DUMP_PATH = 'panel_dump.html'
+HEAD_BYTES = 20000
 
 try:
-    with open('panel_dump.html', 'r', encoding='utf-8', errors='ignore') as f:
-        html = f.read()
+    # Only the head is needed for the button scan
+    with open(DUMP_PATH, 'rb') as f:
+        head = f.read(HEAD_BYTES).decode('utf-8', errors='ignore')
 except FileNotFoundError:
     print("panel_dump.html not found.")
     sys.exit(1)
 
 print("=== BUTTONS IN FIRST 20kb ===")
-buttons = re.findall(r'<button[^>]*>.*?</button>', html[:20000], re.DOTALL | re.IGNORECASE)
-for b in buttons[:10]:
+head_soup = BeautifulSoup(head, 'html.parser')
+buttons = head_soup.find_all('button', limit=10)
+for b in buttons:
     print(b)
     print("-" * 20)
 
 print("\n=== ROWS WITH BUTTONS ===")
-# Find table rows that contain buttons
-rows = re.findall(r'<tr[^>]*>.*?</tr>', html, re.DOTALL | re.IGNORECASE)
+# Find table rows that contain buttons (only <tr> subtrees are built)
+with open(DUMP_PATH, 'r', encoding='utf-8', errors='ignore') as f:
+    soup = BeautifulSoup(f, 'html.parser', parse_only=SoupStrainer('tr'))
+rows = soup.find_all('tr')
 print(f"Total rows found: {len(rows)}")
 
 if rows:
     first_data_row = None
     # Skip header row if possible
     for r in rows:
-        if '<th' not in r:
+        if r.find('th') is None:
             first_data_row = r
             break
-            
+
     if first_data_row:
         print("First data row content (truncated):")
-        print(first_data_row[:500] + "...")
-        
+        print(str(first_data_row)[:500] + "...")
+
         # Check for buttons within this row
-        row_buttons = re.findall(r'<button[^>]*>.*?</button>', first_data_row, re.DOTALL | re.IGNORECASE)
+        row_buttons = first_data_row.find_all('button')
         print(f"\nButtons in first data row: {len(row_buttons)}")
         for b in row_buttons:
             print(b)
@@ -1,42 +1,86 @@
 """Capture DOM selectors from CA UCC site at each interaction stage."""
-import asyncio, os, json
-from playwright.async_api import async_playwright
+import asyncio, os, json, hashlib, shutil
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 OUT = os.path.join(os.environ.get('TEMP', '/tmp'), 'dom_capture')
 os.makedirs(OUT, exist_ok=True)
 
+ELEMENTS_JS = """() => {
+    const els = [];
+    const all = document.querySelectorAll('input,select,button,a,[role="button"],[role="row"],[role="link"]');
+    for (let i = 0, n = all.length; i < n; i++) {
+        const el = all[i];
+        // Skip nodes that are not rendered at all
+        if (!el.getClientRects().length) continue;
+        const text = el.textContent.trim();
+        const isField = el.tagName === 'INPUT' || el.tagName === 'SELECT';
+        // Text-less links/rows are noise unless they carry an id or aria-label
+        if (!text && !isField && !el.id && !el.getAttribute('aria-label')) continue;
+        els.push({
+            tag: el.tagName,
+            type: el.type || '',
+            id: el.id || '',
+            name: el.name || '',
+            className: el.className || '',
+            placeholder: el.placeholder || '',
+            value: el.value || '',
+            textContent: text.substring(0, 80),
+            role: el.getAttribute('role') || '',
+            href: el.href || '',
+            disabled: el.disabled || false,
+            visible: el.offsetParent !== null,
+            options: el.tagName === 'SELECT' ? Array.from(el.options).map(o => ({value: o.value, text: o.text})) : []
+        });
+        if (els.length >= 500) break;
+    }
+    return els;
+}"""
+
+def _write_json(path, data):
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+# Digest of the last screenshotted DOM state and where that screenshot lives
+_last_shot = {'digest': None, 'path': None}
+
 async def dump(page, label):
     """Save screenshot + HTML + element inventory."""
-    await page.screenshot(path=os.path.join(OUT, f'{label}.png'), full_page=True)
-    html = await page.content()
-    with open(os.path.join(OUT, f'{label}.html'), 'w', encoding='utf-8') as f:
-        f.write(html)
-    # Dump interactive elements
-    info = await page.evaluate("""() => {
-        const els = [];
-        document.querySelectorAll('input,select,button,a,[role="button"],[role="row"],[role="link"]').forEach(el => {
-            els.push({
-                tag: el.tagName,
-                type: el.type || '',
-                id: el.id || '',
-                name: el.name || '',
-                className: el.className || '',
-                placeholder: el.placeholder || '',
-                textContent: el.textContent.trim().substring(0, 80),
-                role: el.getAttribute('role') || '',
-                href: el.href || '',
-                disabled: el.disabled || false,
-                visible: el.offsetParent !== null,
-                options: el.tagName === 'SELECT' ? Array.from(el.options).map(o => ({value: o.value, text: o.text})) : []
-            });
-        });
-        return els;
-    }""")
-    with open(os.path.join(OUT, f'{label}_elements.json'), 'w') as f:
-        json.dump(info, f, indent=2)
+    # Independent CDP calls, so keep them in flight together
+    html, info = await asyncio.gather(page.content(), page.evaluate(ELEMENTS_JS))
+
+    # Form values live in element properties, not the serialized HTML, so
+    # the inventory (which carries them) is part of the digest too
+    h = hashlib.blake2b(html.encode('utf-8'), digest_size=8)
+    h.update(json.dumps(info, sort_keys=True).encode('utf-8'))
+    digest = h.digest()
+
+    png_path = os.path.join(OUT, f'{label}.png')
+    if digest == _last_shot['digest']:
+        # Unchanged page: reuse the previous PNG instead of re-rasterizing
+        shot = asyncio.to_thread(shutil.copyfile, _last_shot['path'], png_path)
+    else:
+        shot = page.screenshot(path=png_path, full_page=True)
+        _last_shot.update(digest=digest, path=png_path)
+
+    # Keep the event loop free while multi-MB artifacts hit the disk
+    await asyncio.gather(
+        shot,
+        asyncio.to_thread(Path(OUT, f'{label}.html').write_text, html, encoding='utf-8'),
+        asyncio.to_thread(_write_json, os.path.join(OUT, f'{label}_elements.json'), info),
+    )
     print(f"[{label}] {len(info)} interactive elements captured")
 
 async def main():
+    from playwright.async_api import async_playwright
+
     async with async_playwright() as pw:
         browser = await pw.chromium.launch(headless=True)
         ctx = await browser.new_context(viewport={'width': 1920, 'height': 1080},
@@ -46,7 +90,10 @@ async def main():
         # Stage 1: Initial load
         print("Stage 1: Loading page...")
         await page.goto('https://bizfileonline.sos.ca.gov/search/ucc', wait_until='networkidle', timeout=30000)
-        await asyncio.sleep(2)
+        try:
+            await page.locator('input[placeholder*="Search by name"]').wait_for(state='visible', timeout=5000)
+        except Exception:
+            print("  ! Search input did not appear")
         await dump(page, '1_initial')
 
         # Stage 2: Click Advanced
@@ -54,34 +101,42 @@ async def main():
         adv = await page.query_selector('button.advanced-search-toggle')
         if adv:
             await adv.click()
-            await asyncio.sleep(1)
+            try:
+                await page.locator('#field-RECORD_TYPE_ID').wait_for(state='visible', timeout=5000)
+            except Exception:
+                print("  ! Advanced fields did not appear")
         await dump(page, '2_advanced')
 
         # Stage 3: Fill form and search
         print("Stage 3: Filling form...")
-        search_input = await page.query_selector('input[placeholder*="Search by name"]')
-        if search_input:
-            await search_input.fill('Internal Revenue Service')
+        search_sel = 'input[placeholder*="Search by name"]'
+        start_sel = '#field-date-FILING_DATEs'
+        end_sel = '#field-date-FILING_DATEe'
+        type_sel = '#field-RECORD_TYPE_ID'
+        # One round-trip to check which fields exist before filling them
+        has_search, has_start, has_end, has_type = await page.evaluate(
+            "sels => sels.map(s => !!document.querySelector(s))",
+            [search_sel, start_sel, end_sel, type_sel])
+
+        if has_search:
+            await page.fill(search_sel, 'Internal Revenue Service')
             print("  Filled search input")
 
         # Try filling dates
-        date_start = await page.query_selector('#field-date-FILING_DATEs')
-        date_end = await page.query_selector('#field-date-FILING_DATEe')
-        if date_start:
-            await date_start.fill('01/18/2026')
+        if has_start:
+            await page.fill(start_sel, '01/18/2026')
             print("  Filled start date")
         else:
             print("  ! No start date field found")
-        if date_end:
-            await date_end.fill('02/17/2026')
+        if has_end:
+            await page.fill(end_sel, '02/17/2026')
             print("  Filled end date")
         else:
             print("  ! No end date field found")
 
         # Try selecting Federal Tax Lien
-        record_type = await page.query_selector('#field-RECORD_TYPE_ID')
-        if record_type:
-            await record_type.select_option(label='Federal Tax Lien')
+        if has_type:
+            await page.select_option(type_sel, label='Federal Tax Lien')
             print("  Selected Federal Tax Lien")
         else:
             print("  ! No record type select found")
@@ -103,8 +158,13 @@ async def main():
             await page.wait_for_selector('.search-results, .results-table, table, .record-row, [class*="result"]', timeout=15000)
             print("  Results selector found!")
         except:
-            print("  ! Primary result selector not found, waiting 8s...")
-            await asyncio.sleep(8)
+            print("  ! Primary result selector not found, waiting up to 8s for rows...")
+            try:
+                await page.wait_for_function(
+                    """() => document.querySelectorAll('tr,[class*="result"]').length > 0""",
+                    timeout=8000)
+            except Exception:
+                print("  ! No result rows appeared")
 
         await dump(page, '4_results')
 
@@ -138,8 +198,7 @@ async def main():
             return info;
         }""")
         print(f"  Tables: {structure['tables']}, Result-like rows: {len(structure['rows'])}, Detail links: {len(structure['links'])}")
-        with open(os.path.join(OUT, '5_result_structure.json'), 'w') as f:
-            json.dump(structure, f, indent=2)
+        await asyncio.to_thread(_write_json, os.path.join(OUT, '5_result_structure.json'), structure)
 
         # If we got results, try clicking the first one
         if structure['rows']:
@@ -148,7 +207,15 @@ async def main():
             first_row = await page.query_selector('[class*="record"]:has-text("Internal Revenue"), [class*="result"]:has-text("Internal Revenue"), tr:has-text("Internal Revenue")')
             if first_row:
                 await first_row.click()
-                await asyncio.sleep(2)
+                # The page is already network-idle; wait for the detail panel
+                # itself (same locator as debug_panel.py) before dumping it
+                panel = page.locator(
+                    '[class*="detail"], [class*="panel"], [class*="side"]'
+                ).filter(has_text="Internal Revenue")
+                try:
+                    await panel.first.wait_for(state="visible", timeout=5000)
+                except Exception:
+                    print("  Detail panel did not open within 5s, dumping anyway")
                 await dump(page, '6_detail')
             else:
                 print("  Could not find clickable result row")
@@ -156,4 +223,5 @@ async def main():
         await browser.close()
         print(f"\nAll artifacts saved to: {OUT}")
 
-asyncio.run(main())
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -10,6 +10,7 @@ import os
 import sys
 import json
 from datetime import datetime, timedelta
+from pathlib import Path
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -67,14 +68,18 @@ async def main():
             # Check verification targets
             detail_html = os.path.join(scraper.output_dir, "04_detail.html")
             final_url = os.path.join(scraper.output_dir, "final_url.txt")
-            if os.path.exists(detail_html) and os.path.getsize(detail_html) > 0:
-                logger.info(f"✓ detail.html exists ({os.path.getsize(detail_html)} bytes)")
+            try:
+                detail_size = os.stat(detail_html).st_size
+            except OSError:
+                detail_size = 0
+            if detail_size > 0:
+                logger.info(f"✓ detail.html exists ({detail_size} bytes)")
             else:
                 logger.info(f"✗ detail.html not found or empty")
-            if os.path.exists(final_url):
-                with open(final_url) as f:
-                    logger.info(f"✓ final_url.txt: {f.read().strip()}")
-            else:
+            try:
+                url = Path(final_url).read_text(encoding='utf-8').strip()
+                logger.info(f"✓ final_url.txt: {url}")
+            except FileNotFoundError:
                 logger.info(f"✗ final_url.txt not found")
 
     except Exception as e:
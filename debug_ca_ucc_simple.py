@@ -2,14 +2,17 @@
 import asyncio
 from playwright.async_api import async_playwright
 
+PROFILE_DIR = ".pw-debug"
+
 async def main():
     print("Launching browser...")
     async with async_playwright() as p:
-        browser = await p.chromium.launch(
+        # Persistent profile: cookies/cache (incl. the bot-check ones) carry over
+        # between debug runs instead of starting from an empty profile each time
+        context = await p.chromium.launch_persistent_context(
+            PROFILE_DIR,
             headless=True,
-            args=["--disable-blink-features=AutomationControlled"]
-        )
-        context = await browser.new_context(
+            args=["--disable-blink-features=AutomationControlled"],
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
             viewport={"width": 1920, "height": 1080}
         )
@@ -50,7 +53,7 @@ async def main():
         except Exception as e:
             print(f"Critical error: {e}")
             
-        await browser.close()
+        await context.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -5,13 +5,16 @@ import asyncio
 import re
 from playwright.async_api import async_playwright
 
+PROFILE_DIR = ".pw-debug"
+
 async def main():
     async with async_playwright() as p:
-        browser = await p.chromium.launch(
+        # Persistent profile: cookies/cache (incl. the bot-check ones) carry over
+        # between debug runs instead of starting from an empty profile each time
+        ctx = await p.chromium.launch_persistent_context(
+            PROFILE_DIR,
             headless=True,
-            args=["--disable-blink-features=AutomationControlled"]
-        )
-        ctx = await browser.new_context(
+            args=["--disable-blink-features=AutomationControlled"],
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
             viewport={"width": 1920, "height": 1080}
         )
@@ -19,9 +22,11 @@ async def main():
 
         print("Navigating...")
         await page.goto("https://bizfileonline.sos.ca.gov/search/ucc")
-        await page.wait_for_load_state("networkidle")
 
-        await page.get_by_role("textbox", name="Search by name or file number").fill("Internal Revenue Service")
+        # Wait on the elements we use next rather than for network idle
+        search_box = page.get_by_role("textbox", name="Search by name or file number")
+        await search_box.wait_for(state="visible", timeout=15000)
+        await search_box.fill("Internal Revenue Service")
         await page.get_by_role("button", name=re.compile(r"Advanced", re.I)).click()
         await page.locator("#field-RECORD_TYPE_ID").wait_for(state="visible")
         await page.locator("#field-RECORD_TYPE_ID").select_option(label="Federal Tax Lien")
@@ -29,11 +34,11 @@ async def main():
         await page.locator("#field-date-FILING_DATEe").fill("01/25/2026")
         await page.locator("#field-date-FILING_DATEe").press("Tab")
         await page.get_by_role("button", name="Search").click()
-        await page.wait_for_load_state("networkidle")
+        rows = page.locator("table tbody tr")
+        await rows.first.wait_for(state="visible", timeout=15000)
         print("Search done. Clicking first row...")
 
         # Click first data row
-        rows = page.locator("table tbody tr")
         count = await rows.count()
         print(f"Found {count} rows")
 
@@ -47,7 +52,14 @@ async def main():
                 file_num = (await cells.nth(2).text_content() or "").strip()
                 print(f"Clicking row {i}, file_number={file_num}")
                 await cells.first.click()
-                await page.wait_for_timeout(3000)
+                # Panel is keyed by file number (same locator as the scraper)
+                panel = page.locator(
+                    '[class*="detail"], [class*="panel"], [class*="side"]'
+                ).filter(has_text=file_num)
+                try:
+                    await panel.first.wait_for(state="visible", timeout=5000)
+                except Exception:
+                    print("Panel did not open within 5s, dumping anyway")
                 break
 
         # Dump full page HTML
@@ -60,6 +72,6 @@ async def main():
         await page.screenshot(path="panel_screenshot.png", full_page=False)
         print("Saved panel_screenshot.png")
 
-        await browser.close()
+        await ctx.close()
 
 asyncio.run(main())
@@ -16,46 +16,170 @@ Usage:
         --timeout 300s
 """
 
-# Add src to path before other imports
-import os
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
 # Standard library imports
+import os
 import json
+import atexit
 import asyncio
-from datetime import datetime
-from typing import Dict, Any
-
-# Project imports
-from src.browser_automation import scrape_nyc_acris
-from src.pdf_extractor import PDFExtractor, FieldExtractor
+import functools
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, NamedTuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Project imports (Playwright, PDF/OCR and Google client modules are
+# imported where they are used, so cold starts only pay for what runs)
 from src.field_mapper import FieldMapper
 from src.accuracy_verifier import verify_records
-from src.sheets_integration import GoogleSheetsIntegration
 from src.utils import logger, ensure_directories
 
 # Configuration
 SHEET_ID = os.getenv('SHEETS_ID', '18C3Qrk3rEXZ9oNocIEUugFLh6q38DRw9JVwznTHoRN0')
-
-
-async def process_site(site_id: str, max_results: int = 50) -> Dict[str, Any]:
-    """Process a single site and return results"""
-    logger.info(f"Processing site {site_id}")
-
-    site_results = {
+# Max sites processed concurrently (each may hold a browser session)
+SITE_CONCURRENCY = int(os.getenv('SITE_CONCURRENCY', '4'))
+# Max records downloaded/extracted concurrently within a site
+DOWNLOAD_CONCURRENCY = int(os.getenv('DOWNLOAD_CONCURRENCY', '8'))
+# Lookback window for date-ranged searches when none is given
+DEFAULT_DATE_RANGE_DAYS = int(os.getenv('DEFAULT_DATE_RANGE_DAYS', '30'))
+# Verified records per Sheets write while a site is still downloading
+WRITE_BATCH_SIZE = int(os.getenv('WRITE_BATCH_SIZE', '50'))
+# Processes for CPU-bound PDF text/OCR extraction (1 = in the record's thread);
+# each is a spawned interpreter next to Chromium, so at most 2 by default
+PDF_PROCESSES = int(os.getenv('PDF_PROCESSES', str(min(2, os.cpu_count() or 1))))
+# Downloaded PDFs kept in /tmp (memory-backed) across invocations; 0 = off
+PDF_CACHE_MB = int(os.getenv('PDF_CACHE_MB', '0'))
+# Include the CA UCC scraper's debug info in responses (UCC_DEBUG=1)
+UCC_DEBUG = os.getenv('UCC_DEBUG') == '1'
+# Site ID -> FieldMapper site key
+SITE_KEYS = {
+    '12': 'nyc_acris',
+    '10': 'cook_county',
+    '20': 'ca_sos',
+    '11': 'dallas_county'
+}
+# Sites scraped with Playwright (they share one browser per invocation)
+BROWSER_SITES = {'12', '20'}
+
+
+class RawRecord(NamedTuple):
+    """Scraped record in the shape _extract_and_map expects"""
+    site_id: str
+    raw_text: str
+    pdf_url: Optional[str]
+    filing_date: Optional[str]
+
+
+def _to_json(data: Dict[str, Any], pretty: bool = False):
+    """Serialize a response body compactly, with orjson when it is installed"""
+    if pretty:
+        return json.dumps(data, indent=2)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(',', ':'))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_sheets():
+    """Sheets client shared across sites and warm invocations (auth once)"""
+    from src.sheets_integration import GoogleSheetsIntegration  # lazy import
+    return GoogleSheetsIntegration(SHEET_ID)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_pdf_extractor():
+    """PDF downloader/extractor shared by all records (stateless per call)"""
+    from src.pdf_extractor import PDFExtractor  # lazy import
+    return PDFExtractor(processes=PDF_PROCESSES, cache_bytes=PDF_CACHE_MB * 1024 * 1024)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_field_extractor():
+    """Field extractor shared by all records (stateless per call)"""
+    from src.pdf_extractor import FieldExtractor  # lazy import
+    return FieldExtractor()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_mapper(site_id: str) -> FieldMapper:
+    """One FieldMapper per site, shared by its records (it holds no per-record state)"""
+    return FieldMapper(SITE_KEYS.get(site_id, 'unknown'))
+
+
+def _extract_pdf_fields(pdf_text: str, filing_date: Optional[str]) -> Dict[str, str]:
+    """Extract PDF fields under the keys FieldMapper reads"""
+    field_extractor = _get_field_extractor()
+    raw = field_extractor.extract_raw_fields(pdf_text)
+
+    fields = {}
+    lien_date = field_extractor.extract_lien_or_receive_date(
+        pdf_text,
+        recorder_stamp_date=None,
+        results_table_filing_date=filing_date,
+    )
+    if lien_date:
+        fields['lien_date'] = lien_date
+    if raw.get('amount'):
+        fields['amount'] = raw['amount']
+    if raw.get('taxpayer_name'):
+        fields['taxpayer_name'] = raw['taxpayer_name']
+    if raw.get('address_street'):
+        fields['address'] = raw['address_street']
+
+    # FieldMapper parses "City, ST 12345"
+    city, state, zip_code = (
+        raw.get('address_city'), raw.get('address_state'), raw.get('address_zip')
+    )
+    if city and state:
+        fields['city_state_zip'] = f"{city}, {state} {zip_code or ''}".strip()
+    return fields
+
+
+def _extract_and_map(raw_record, site_id: str, pdf_data: Optional[bytes] = None):
+    """Extract fields from a record's downloaded PDF (if any) and map them (blocking)"""
+    # Step 1: Extract fields from PDF if one was downloaded
+    extracted_fields = {}
+    if pdf_data is not None:
+        pdf_result = _get_pdf_extractor().extract_downloaded(raw_record.pdf_url, pdf_data)
+        # RawRecord carries filing_date; NYC's browser_automation.LienRecord
+        # carries the results-table filing date as lien_date
+        filing_date = getattr(raw_record, 'filing_date', getattr(raw_record, 'lien_date', None))
+        extracted_fields = _extract_pdf_fields(pdf_result.all_text, filing_date)
+
+    # Step 2: Map to standardized format
+    return _get_mapper(site_id).map_record(
+        extracted_fields,
+        raw_record.raw_text
+    )
+
+
+def _empty_site_result(site_id: str, errors: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Per-site result with zeroed counts (shared by success and failure paths)"""
+    return {
         'site_id': site_id,
         'records_found': 0,
         'records_processed': 0,
         'records_written': 0,
         'duplicates_skipped': 0,
-        'errors': []
+        'errors': errors if errors is not None else []
     }
 
+
+async def process_site(site_id: str, max_results: int = 50, browser=None) -> Dict[str, Any]:
+    """Process a single site and return results (on a shared browser if given)"""
+    logger.info("Processing site %s", site_id)
+
+    site_results = _empty_site_result(site_id)
+
     try:
         # Site-specific processing
         if site_id == '12':  # NYC ACRIS
-            raw_records = await scrape_nyc_acris()
+            from src.browser_automation import scrape_nyc_acris  # lazy import
+
+            raw_records = await scrape_nyc_acris(browser)
         elif site_id == '10':  # Cook County
             logger.warning("Cook County scraper not yet implemented")
             raw_records = []
@@ -63,11 +187,10 @@ async def process_site(site_id: str, max_results: int = 50) -> Dict[str, Any]:
             from src.scrapers.ca_ucc_scraper_playwright import CAUCCScraper
 
             try:
-                async with CAUCCScraper() as scraper:
-                    # Calculate date range (last 30 days for better chances)
-                    from datetime import datetime, timedelta
+                async with CAUCCScraper(browser=browser) as scraper:
+                    # Calculate date range (last 30 days by default for better chances)
                     to_date = datetime.now()
-                    from_date = to_date - timedelta(days=30)
+                    from_date = to_date - timedelta(days=DEFAULT_DATE_RANGE_DAYS)
 
                     from_date_str = from_date.strftime("%m/%d/%Y")
                     to_date_str = to_date.strftime("%m/%d/%Y")
@@ -79,22 +202,23 @@ async def process_site(site_id: str, max_results: int = 50) -> Dict[str, Any]:
                         max_results=max_results
                     )
 
-                    # Store debug info in results
-                    site_results['debug_info'] = debug_info
+                    # Store debug info in results only when asked for
+                    if UCC_DEBUG:
+                        site_results['debug_info'] = debug_info
 
                     # Convert to raw record format
                     raw_records = []
                     for record in lien_records:
-                        raw_records.append(type('Record', (), {
-                            'site_id': '20',
-                            'raw_text': json.dumps(record.to_dict()),
-                            'pdf_url': None,
-                            'filing_date': record.lien_or_receive_date
-                        })())
-
-                    logger.info(f"CA UCC scraper found {len(raw_records)} records")
+                        raw_records.append(RawRecord(
+                            site_id='20',
+                            raw_text=json.dumps(record.to_dict()),
+                            pdf_url=None,
+                            filing_date=record.lien_or_receive_date
+                        ))
+
+                    logger.info("CA UCC scraper found %s records", len(raw_records))
             except Exception as e:
-                logger.error(f"CA UCC scraper error: {e}")
+                logger.error("CA UCC scraper error: %s", e)
                 site_results['errors'].append(str(e))
                 raw_records = []
         elif site_id == '11':  # Dallas County
@@ -104,98 +228,228 @@ async def process_site(site_id: str, max_results: int = 50) -> Dict[str, Any]:
             raise ValueError(f"Unknown site_id: {site_id}")
 
         site_results['records_found'] = len(raw_records)
-        logger.info(f"Found {len(raw_records)} records from site {site_id}")
+        logger.info("Found %s records from site %s", len(raw_records), site_id)
 
         if not raw_records:
             return site_results
 
-        # Process each record through extraction pipeline
-        mapped_records = []
-
-        for raw_record in raw_records:
-            try:
-                # Step 1: Extract fields from PDF if URL available
-                extracted_fields = {}
+        # Records are independent: process them concurrently. PDFs download
+        # on the event loop; the blocking OCR/mapping work runs on worker threads
+        semaphore = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+        http = None
+        if any(raw_record.pdf_url for raw_record in raw_records):
+            import aiohttp  # lazy import
+
+            http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=DOWNLOAD_CONCURRENCY, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=30),
+            )
+
+        async def _process_record(index, raw_record):
+            async with semaphore:
+                pdf_data = None
                 if raw_record.pdf_url:
-                    pdf_extractor = PDFExtractor()
-                    pdf_result = pdf_extractor.extract_from_url(raw_record.pdf_url)
-
-                    field_extractor = FieldExtractor()
-                    extracted_fields = field_extractor.extract_all_fields(pdf_result.all_text)
-
-                # Step 2: Map to standardized format
-                site_key = {
-                    '12': 'nyc_acris',
-                    '10': 'cook_county',
-                    '20': 'ca_sos',
-                    '11': 'dallas_county'
-                }.get(site_id, 'unknown')
-
-                mapper = FieldMapper(site_key)
-                mapped_record = mapper.map_record(
-                    extracted_fields,
-                    raw_record.raw_text
+                    pdf_data = await _get_pdf_extractor().fetch_pdf_async(
+                        http, raw_record.pdf_url
+                    )
+                mapped = await asyncio.to_thread(
+                    _extract_and_map, raw_record, site_id, pdf_data
                 )
-
-                mapped_records.append(mapped_record)
+                return index, mapped
+
+        high_confidence_count = 0
+        # Only what the review log needs, so mapped records are freed per batch
+        review_notes = []
+        write_tasks = []
+
+        def _verify_and_write(batch):
+            """Steps 3-4 for a batch: verify, then start its Sheets write"""
+            nonlocal high_confidence_count
+            # Keep the scrape order within a batch
+            batch.sort(key=lambda item: item[0])
+            verified_results = verify_records([record for _, record in batch])
+
+            # Separate high-confidence from needs-review
+            high_confidence_records = []
+            for record, report in verified_results:
+                if report.can_auto_process:
+                    high_confidence_records.append(record)
+                else:
+                    review_notes.append((report.record_id, report.recommendations))
+            high_confidence_count += len(high_confidence_records)
+
+            if high_confidence_records:
+                rows = [record.to_row() for record in high_confidence_records]
+                # gspread is blocking; keep the loop free for the other sites
+                write_tasks.append(asyncio.ensure_future(
+                    asyncio.to_thread(_get_sheets().write_liens, rows)
+                ))
+
+        # Verify and write in batches as records finish, so Sheets round-trips
+        # overlap the remaining downloads and only one batch is buffered
+        record_tasks = [
+            asyncio.ensure_future(_process_record(i, raw_record))
+            for i, raw_record in enumerate(raw_records)
+        ]
+        settled = 0
+        batch = []
+        try:
+            for next_outcome in asyncio.as_completed(record_tasks):
+                try:
+                    outcome = await next_outcome
+                except Exception as e:
+                    logger.error("Failed to process record: %s", e)
+                    site_results['errors'].append(str(e))
+                    continue
+                finally:
+                    settled += 1
+                batch.append(outcome)
                 site_results['records_processed'] += 1
+                if len(batch) >= WRITE_BATCH_SIZE:
+                    _verify_and_write(batch)
+                    batch = []
+            if batch:
+                _verify_and_write(batch)
+        finally:
+            # If verification or scheduling raised partway, stop the records
+            # still in flight and say how many were dropped
+            pending = [task for task in record_tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if settled < len(record_tasks):
+                site_results['errors'].append(
+                    f"{len(record_tasks) - settled} records not processed after a failure"
+                )
+            if http is not None:
+                await http.close()
 
-            except Exception as e:
-                logger.error(f"Failed to process record: {e}")
-                site_results['errors'].append(str(e))
-
-        # Step 3: Verify accuracy
-        verified_results = verify_records(mapped_records)
-
-        # Separate high-confidence from needs-review
-        high_confidence_records = []
-        low_confidence_records = []
-
-        for record, report in verified_results:
-            if report.can_auto_process:
-                high_confidence_records.append(record)
-            else:
-                low_confidence_records.append((record, report))
-
-        logger.info(f"High confidence: {len(high_confidence_records)}, "
-                   f"Needs review: {len(low_confidence_records)}")
-
-        # Step 4: Write to Google Sheets
-        if high_confidence_records:
-            sheets = GoogleSheetsIntegration(SHEET_ID)
-
-            # Convert to rows
-            rows = [record.to_row() for record in high_confidence_records]
-
-            result = sheets.write_liens(rows)
+            # Settle every write already started, recording each failure
+            for result in await asyncio.gather(*write_tasks, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error("Sheets write failed for site %s: %s", site_id, result)
+                    site_results['errors'].append(str(result))
+                    continue
+                site_results['records_written'] += result.rows_written
+                site_results['duplicates_skipped'] += result.duplicates_skipped
 
-            site_results['records_written'] = result.rows_written
-            site_results['duplicates_skipped'] = result.duplicates_skipped
+                if result.errors:
+                    site_results['errors'].extend(result.errors)
 
-            if result.errors:
-                site_results['errors'].extend(result.errors)
+        logger.info("High confidence: %s, Needs review: %s",
+                    high_confidence_count, len(review_notes))
 
         # Log low-confidence records for manual review
-        if low_confidence_records:
-            logger.warning(f"{len(low_confidence_records)} records need manual review")
-            for record, report in low_confidence_records:
-                logger.warning(f"  - {report.record_id}: {report.recommendations}")
+        if review_notes:
+            logger.warning(
+                "%s records need manual review:\n%s",
+                len(review_notes),
+                "\n".join(
+                    f"  - {record_id}: {recommendations}"
+                    for record_id, recommendations in review_notes
+                ),
+            )
 
         return site_results
 
     except Exception as e:
-        logger.error(f"Site {site_id} processing failed: {e}")
+        logger.error("Site %s processing failed: %s", site_id, e)
         site_results['errors'].append(str(e))
         return site_results
 
 
+# Event loop kept alive across warm invocations, on its own thread so
+# concurrent requests can share it. Playwright objects are bound to the
+# loop that created them, so the shared browser lives here too.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+_BROWSER = None  # (playwright, browser) once launched
+_BROWSER_LOCK: Optional[asyncio.Lock] = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Start the background event loop on first use"""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name='pipeline-loop', daemon=True).start()
+            atexit.register(_shutdown_browser)
+    return _LOOP
+
+
+async def _get_browser():
+    """Chromium shared by all sites and warm invocations (relaunched if it died)"""
+    global _BROWSER, _BROWSER_LOCK
+    if _BROWSER_LOCK is None:
+        _BROWSER_LOCK = asyncio.Lock()
+    async with _BROWSER_LOCK:
+        if _BROWSER is None or not _BROWSER[1].is_connected():
+            from src.browser_automation import launch_browser  # lazy import
+            _BROWSER = await launch_browser()
+    return _BROWSER[1]
+
+
+async def _close_browser():
+    """Close the shared browser and stop its Playwright driver"""
+    global _BROWSER
+    if _BROWSER is None:
+        return
+    playwright, browser = _BROWSER
+    _BROWSER = None
+    await browser.close()
+    await playwright.stop()
+
+
+def _shutdown_browser():
+    """atexit hook: close the shared browser on its own loop"""
+    if _LOOP is not None and _BROWSER is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(_close_browser(), _LOOP).result(timeout=10)
+        except Exception as e:
+            logger.warning("Could not close shared browser: %s", e)
+
+
+async def process_sites(sites: List[str], max_results: int = 50) -> List[Dict[str, Any]]:
+    """Process sites concurrently (bounded by SITE_CONCURRENCY), in request order"""
+    semaphore = asyncio.Semaphore(SITE_CONCURRENCY)
+
+    # Reuse the instance's Chromium; each scraper only opens its own context on it
+    browser = None
+    if BROWSER_SITES.intersection(sites):
+        try:
+            browser = await _get_browser()
+        except Exception as e:
+            logger.error("Shared browser launch failed, scrapers will launch their own: %s", e)
+
+    async def _bounded(site_id: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await process_site(site_id, max_results, browser)
+
+    outcomes = await asyncio.gather(
+        *(_bounded(site_id) for site_id in sites),
+        return_exceptions=True
+    )
+
+    all_results = []
+    for site_id, outcome in zip(sites, outcomes):
+        if isinstance(outcome, Exception):
+            logger.error("Failed to process site %s: %s", site_id, outcome)
+            all_results.append(_empty_site_result(site_id, [str(outcome)]))
+        else:
+            all_results.append(outcome)
+
+    return all_results
+
+
 def main(request):
     """
     Cloud Function entry point
 
     Expected request body (JSON):
     {
-        "sites": ["12", "10", "20"]  // Optional, defaults to all
+        "sites": ["12", "10", "20"],  // Optional, defaults to all
+        "pretty": true                 // Optional, indented JSON response
     }
 
     Returns:
@@ -205,47 +459,52 @@ def main(request):
         "results": [...]
     }
     """
+    # One run timestamp for whichever response goes out
+    timestamp = datetime.now().isoformat()
+    pretty = False
     try:
         logger.info("Starting Federal Tax Lien Extraction Pipeline")
-        ensure_directories()
 
         # Parse request
         if request and hasattr(request, 'get_json'):
             request_json = request.get_json(silent=True) or {}
         else:
             request_json = {}
+        pretty = bool(request_json.get('pretty'))
 
         # Get sites to process (default to all)
         sites = request_json.get('sites', ['12', '10', '20'])
         max_results = request_json.get('max_results', 50)
-        logger.info(f"Processing sites: {sites} with max_results={max_results}")
 
-        # Process all sites
-        all_results = []
+        # Reject malformed requests before touching disk or launching anything
+        if not isinstance(sites, list) or not sites:
+            logger.warning("Rejected request with invalid sites: %r", sites)
+            return (_to_json({
+                'success': False,
+                'timestamp': timestamp,
+                'error': "'sites' must be a non-empty list of site IDs"
+            }, pretty), 400, {
+                'Content-Type': 'application/json'
+            })
 
-        for site_id in sites:
-            try:
-                # Run async processing in sync context
-                result = asyncio.run(process_site(site_id, max_results))
-                all_results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to process site {site_id}: {e}")
-                all_results.append({
-                    'site_id': site_id,
-                    'records_found': 0,
-                    'records_processed': 0,
-                    'records_written': 0,
-                    'duplicates_skipped': 0,
-                    'errors': [str(e)]
-                })
-
-        # Calculate totals
-        total_found = sum(r['records_found'] for r in all_results)
-        total_written = sum(r['records_written'] for r in all_results)
+        ensure_directories()
+        logger.info("Processing sites: %s with max_results=%s", sites, max_results)
+
+        # Process all sites on the instance's event loop so their I/O overlaps
+        # and the browser launched by earlier invocations is reused
+        all_results = asyncio.run_coroutine_threadsafe(
+            process_sites(sites, max_results), _get_loop()
+        ).result()
+
+        # Calculate totals (one pass over the site results)
+        total_found = total_written = 0
+        for r in all_results:
+            total_found += r['records_found']
+            total_written += r['records_written']
 
         response = {
             'success': True,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'sites_processed': len(sites),
             'total_records_found': total_found,
             'total_records_written': total_written,
@@ -253,20 +512,20 @@ def main(request):
             'results': all_results
         }
 
-        logger.info(f"Pipeline complete: {total_written} records written")
+        logger.info("Pipeline complete: %s records written", total_written)
 
-        return (json.dumps(response, indent=2), 200, {
+        return (_to_json(response, pretty), 200, {
             'Content-Type': 'application/json'
         })
 
     except Exception as e:
-        logger.error(f"Pipeline failed: {e}")
+        logger.error("Pipeline failed: %s", e)
         error_response = {
             'success': False,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'error': str(e)
         }
-        return (json.dumps(error_response), 500, {
+        return (_to_json(error_response, pretty), 500, {
             'Content-Type': 'application/json'
         })
 
@@ -280,4 +539,5 @@ if __name__ == "__main__":
 
     request = MockRequest()
     response = main(request)
-    print(response[0])
+    body = response[0]
+    print(body.decode() if isinstance(body, bytes) else body)
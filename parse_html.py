@@ -1,6 +1,12 @@
 from bs4 import BeautifulSoup
 import os
 
+try:
+    import lxml  # noqa: F401  (C parser, much faster than html.parser)
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
 temp_dir = os.environ.get('TEMP')
 html_path = os.path.join(temp_dir, 'ca_sos_results.html')
 
@@ -9,11 +15,13 @@ if not os.path.exists(html_path):
     exit(1)
 
 with open(html_path, 'r', encoding='utf-8') as f:
-    soup = BeautifulSoup(f.read(), 'html.parser')
+    soup = BeautifulSoup(f.read(), PARSER)
 
 print(f"Page Title: {soup.title.string if soup.title else 'No Title'}")
 
-tables = soup.find_all('table')
+# One tree walk for both tables and pagination links
+elements = soup.find_all(['table', 'a'])
+tables = [el for el in elements if el.name == 'table']
 print(f"Tables found: {len(tables)}")
 
 for i, table in enumerate(tables):
@@ -24,11 +32,15 @@ for i, table in enumerate(tables):
         print(f"Headers: {headers}")
 
 # Check for pagination
-page_links = soup.find_all('a', class_='page-link') # Common class, might vary
+page_links = [  # Common class, might vary
+    el for el in elements
+    if el.name == 'a' and 'page-link' in (el.get('class') or [])
+]
 print(f"Pagination links found: {len(page_links)}")
 for link in page_links:
     print(f"Link: {link.text.strip()}, Href: {link.get('href')}")
 
 # Check for "No results" message
-if "no records found" in soup.text.lower() or "0 result" in soup.text.lower():
+page_text = soup.get_text().lower()
+if "no records found" in page_text or "0 result" in page_text:
     print("Likely NO RESULTS found.")
@@ -5,25 +5,38 @@ Validates extracted fields against known patterns and flags low-confidence extra
 
 import re
 import logging
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 from dataclasses import dataclass
 from .field_mapper import MappedRecord, MappedField
 
 logger = logging.getLogger(__name__)
 
+# Ad-hoc patterns used by the name/street validators
+_NAME_HAS_DIGIT = re.compile(r'\d')
+_STREET_HAS_NUM = re.compile(r'^\d+')
 
-@dataclass
+# Known values, in the order they are listed in suggestions
+_LIABILITY_TYPES = ('IRS', 'State', 'Local')
+_LEAD_TYPES = ('Lien', 'Release', 'UCC', 'Mechanic')
+_LIABILITY_TYPES_HINT = f'Expected one of: {", ".join(_LIABILITY_TYPES)}'
+_LEAD_TYPES_HINT = f'Expected one of: {", ".join(_LEAD_TYPES)}'
+
+# Shared issues/suggestions for fields that passed cleanly
+_EMPTY: Tuple[str, ...] = ()
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Result of field validation"""
     field_name: str
     value: str
     is_valid: bool
     confidence: float
-    issues: List[str]
-    suggestions: List[str]
+    issues: Sequence[str]
+    suggestions: Sequence[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationReport:
     """Complete verification report for a record"""
     record_id: str
@@ -43,67 +56,97 @@ class AccuracyVerifier:
     MEDIUM_CONFIDENCE = 0.70
     LOW_CONFIDENCE = 0.50
 
-    # Validation patterns
+    # Validation patterns (date, state and ZIP use the _is_* checks below)
     PATTERNS = {
-        'ssn': r'^\d{3}-\d{2}-\d{4}$|^XXX-XX-\d{4}$',
-        'ein': r'^\d{2}-\d{7}$|^XX-XXXXXXX$',
-        'zip': r'^\d{5}(-\d{4})?$',
-        'amount': r'^\d+$',  # Should be numeric without decimals for storage
-        'date': r'^\d{2}/\d{2}/\d{4}$',
-        'state': r'^[A-Z]{2}$',
+        'ssn': re.compile(r'^\d{3}-\d{2}-\d{4}$|^XXX-XX-\d{4}$'),
+        'ein': re.compile(r'^\d{2}-\d{7}$|^XX-XXXXXXX$'),
+        'amount': re.compile(r'^\d+$'),  # Should be numeric without decimals for storage
     }
 
     # Known values for validation
-    VALID_LIABILITY_TYPES = ['IRS', 'State', 'Local']
-    VALID_LEAD_TYPES = ['Lien', 'Release', 'UCC', 'Mechanic']
-    VALID_BUSINESS_PERSONAL = ['Business', 'Personal', 'Unknown']
+    VALID_LIABILITY_TYPES = frozenset(_LIABILITY_TYPES)
+    VALID_LEAD_TYPES = frozenset(_LEAD_TYPES)
+    VALID_BUSINESS_PERSONAL = frozenset({'Business', 'Personal', 'Unknown'})
+
+    # (record attribute, validator method) pairs checked for every record
+    _FIELD_CHECKS = (
+        ('lien_or_receive_date', '_validate_date'),
+        ('amount', '_validate_amount'),
+        ('lead_type', '_validate_lead_type'),
+        ('lead_source', '_validate_lead_source'),
+        ('liability_type', '_validate_liability_type'),
+        ('business_personal', '_validate_business_personal'),
+        ('company', '_validate_company'),
+        ('first_name', '_validate_name'),
+        ('last_name', '_validate_name'),
+        ('street', '_validate_street'),
+        ('city', '_validate_city'),
+        ('state', '_validate_state'),
+        ('zip_code', '_validate_zip'),
+    )
 
     def __init__(self):
         self.validation_issues = []
-
-    def verify_record(self, record: MappedRecord) -> VerificationReport:
-        """Complete verification of a mapped record"""
-        logger.info(f"Verifying record with site_id {record.site_id}")
-
-        results = []
-        flagged_fields = []
-        recommendations = []
-
-        # Verify each field
-        field_checks = [
-            ('lien_or_receive_date', record.lien_or_receive_date, self._validate_date),
-            ('amount', record.amount, self._validate_amount),
-            ('lead_type', record.lead_type, self._validate_lead_type),
-            ('lead_source', record.lead_source, self._validate_lead_source),
-            ('liability_type', record.liability_type, self._validate_liability_type),
-            ('business_personal', record.business_personal, self._validate_business_personal),
-            ('company', record.company, self._validate_company),
-            ('first_name', record.first_name, self._validate_name),
-            ('last_name', record.last_name, self._validate_name),
-            ('street', record.street, self._validate_street),
-            ('city', record.city, self._validate_city),
-            ('state', record.state, self._validate_state),
-            ('zip_code', record.zip_code, self._validate_zip),
+        cls = type(self)
+        if '_verify_fields' not in cls.__dict__:
+            cls._verify_fields = cls._build_field_verifier()
+
+    @classmethod
+    def _build_field_verifier(cls):
+        """
+        Generate a straight-line function that runs every check in
+        _FIELD_CHECKS and accumulates the report aggregates as it goes.
+
+        The validators stay the single source of truth; the generated code
+        only unrolls the dispatch loop so each record is verified in one
+        frame with direct calls and baked-in thresholds.
+        """
+        namespace = {'LOW': cls.LOW_CONFIDENCE, 'MEDIUM': cls.MEDIUM_CONFIDENCE}
+        lines = [
+            'def _verify_fields(self, record):',
+            '    confidence_sum = 0.0',
+            '    has_low = False',
+            '    flagged = []',
+            '    recommendations = []',
         ]
+        for i, (attr, validator) in enumerate(cls._FIELD_CHECKS):
+            namespace[validator] = getattr(cls, validator)
+            lines += [
+                f'    r{i} = {validator}(self, {attr!r}, record.{attr})',
+                f'    c = r{i}.confidence',
+                '    confidence_sum += c',
+                '    if c < LOW:',
+                '        has_low = True',
+                f'    if not r{i}.is_valid or c < MEDIUM:',
+                f'        flagged.append({attr!r})',
+                f'    if r{i}.suggestions:',
+                f'        recommendations.extend(r{i}.suggestions)',
+            ]
+        results = ', '.join(f'r{i}' for i in range(len(cls._FIELD_CHECKS)))
+        lines.append(
+            f'    return [{results}], confidence_sum, has_low, flagged, recommendations'
+        )
 
-        for field_name, field_data, validator in field_checks:
-            result = validator(field_name, field_data)
-            results.append(result)
+        source = '\n'.join(lines) + '\n'
+        exec(compile(source, f'<{cls.__name__}._verify_fields>', 'exec'), namespace)
+        return namespace['_verify_fields']
 
-            if not result.is_valid or result.confidence < self.MEDIUM_CONFIDENCE:
-                flagged_fields.append(field_name)
+    def verify_record(self, record: MappedRecord) -> VerificationReport:
+        """Complete verification of a mapped record"""
+        logger.info("Verifying record with site_id %s", record.site_id)
 
-            if result.suggestions:
-                recommendations.extend(result.suggestions)
+        # Verify each field, accumulating the aggregates in the same pass
+        (results, confidence_sum, has_low_confidence,
+         flagged_fields, recommendations) = self._verify_fields(record)
 
         # Calculate overall confidence
-        overall_confidence = sum(r.confidence for r in results) / len(results)
+        overall_confidence = confidence_sum / len(results)
 
         # Determine if record can be auto-processed
         can_auto_process = (
             overall_confidence >= self.HIGH_CONFIDENCE and
             len(flagged_fields) <= 2 and  # Allow 2 minor issues
-            not any(r.confidence < self.LOW_CONFIDENCE for r in results)
+            not has_low_confidence
         )
 
         report = VerificationReport(
@@ -113,18 +156,55 @@ class AccuracyVerifier:
             can_auto_process=can_auto_process,
             requires_manual_review=not can_auto_process,
             flagged_fields=flagged_fields,
-            recommendations=list(set(recommendations))  # Remove duplicates
+            recommendations=list(dict.fromkeys(recommendations))  # Remove duplicates, keep order
         )
 
-        logger.info(f"Verification complete: confidence={overall_confidence:.2f}, "
-                   f"can_auto_process={can_auto_process}")
+        logger.info("Verification complete: confidence=%.2f, can_auto_process=%s",
+                    overall_confidence, can_auto_process)
 
         return report
 
+    # The _is_* checks mirror the anchored regexes they replaced, including
+    # `$` also matching before a single trailing newline
+
+    @staticmethod
+    def _is_date(s: str) -> bool:
+        """MM/DD/YYYY check without the regex engine (^\\d{2}/\\d{2}/\\d{4}$)"""
+        if s.endswith('\n'):
+            s = s[:-1]
+        return (
+            len(s) == 10 and s[2] == '/' and s[5] == '/' and
+            s[:2].isdecimal() and s[3:5].isdecimal() and s[6:].isdecimal()
+        )
+
+    @staticmethod
+    def _is_state(s: str) -> bool:
+        """2-letter uppercase state code check (^[A-Z]{2}$)"""
+        if s.endswith('\n'):
+            s = s[:-1]
+        return len(s) == 2 and s.isascii() and s.isalpha() and s.isupper()
+
+    @staticmethod
+    def _is_zip(s: str) -> bool:
+        """5-digit or ZIP+4 check (^\\d{5}(-\\d{4})?$)"""
+        if s.endswith('\n'):
+            s = s[:-1]
+        n = len(s)
+        if n == 5:
+            return s.isdecimal()
+        return n == 10 and s[5] == '-' and s[:5].isdecimal() and s[6:].isdecimal()
+
     def _create_result(self, field_name: str, field: MappedField,
                        is_valid: bool, issues: List[str],
                        suggestions: List[str]) -> ValidationResult:
         """Create validation result with adjusted confidence"""
+        value = field.value or ''
+
+        # Common case: nothing to adjust or report
+        if is_valid and not issues and not suggestions:
+            return ValidationResult(field_name, value, True, field.confidence,
+                                    _EMPTY, _EMPTY)
+
         # Adjust confidence based on validation
         adjusted_confidence = field.confidence
 
@@ -136,7 +216,7 @@ class AccuracyVerifier:
 
         return ValidationResult(
             field_name=field_name,
-            value=field.value or '',
+            value=value,
             is_valid=is_valid,
             confidence=adjusted_confidence,
             issues=issues,
@@ -152,7 +232,7 @@ class AccuracyVerifier:
             return self._create_result(name, field, False,
                 ['Date is missing'], ['Check PDF for filing date'])
 
-        if not re.match(self.PATTERNS['date'], field.value):
+        if not self._is_date(field.value):
             issues.append(f'Date format invalid: {field.value}')
             suggestions.append('Expected format: MM/DD/YYYY')
 
@@ -189,7 +269,7 @@ class AccuracyVerifier:
 
         if field.value not in self.VALID_LEAD_TYPES:
             issues.append(f'Unknown lead type: {field.value}')
-            suggestions.append(f'Expected one of: {", ".join(self.VALID_LEAD_TYPES)}')
+            suggestions.append(_LEAD_TYPES_HINT)
 
         return self._create_result(name, field, len(issues) == 0, issues, suggestions)
 
@@ -211,7 +291,7 @@ class AccuracyVerifier:
 
         if field.value not in self.VALID_LIABILITY_TYPES:
             issues.append(f'Unknown liability type: {field.value}')
-            suggestions.append(f'Expected one of: {", ".join(self.VALID_LIABILITY_TYPES)}')
+            suggestions.append(_LIABILITY_TYPES_HINT)
 
         return self._create_result(name, field, len(issues) == 0, issues, suggestions)
 
@@ -251,7 +331,7 @@ class AccuracyVerifier:
                 issues.append(f'Name seems too short: {field.value}')
                 suggestions.append('Verify name extraction from taxpayer field')
 
-            if re.search(r'\d', field.value):
+            if _NAME_HAS_DIGIT.search(field.value):
                 issues.append(f'Name contains numbers: {field.value}')
                 suggestions.append('Remove numeric characters from name')
 
@@ -267,7 +347,7 @@ class AccuracyVerifier:
             suggestions.append('Check PDF for address block')
         else:
             # Should have street number
-            if not re.search(r'^\d+', field.value):
+            if not _STREET_HAS_NUM.match(field.value):
                 issues.append('Street address may be missing number')
                 suggestions.append('Verify complete address extraction')
 
@@ -295,7 +375,7 @@ class AccuracyVerifier:
         if not field.value:
             issues.append('State is missing')
             suggestions.append('Check address block in PDF')
-        elif not re.match(self.PATTERNS['state'], field.value):
+        elif not self._is_state(field.value):
             issues.append(f'State format invalid: {field.value}')
             suggestions.append('Expected 2-letter state code (e.g., NY, CA, IL)')
 
@@ -309,7 +389,7 @@ class AccuracyVerifier:
         if not field.value:
             issues.append('ZIP code is missing')
             suggestions.append('Check address block in PDF')
-        elif not re.match(self.PATTERNS['zip'], field.value):
+        elif not self._is_zip(field.value):
             issues.append(f'ZIP format invalid: {field.value}')
             suggestions.append('Expected 5-digit or ZIP+4 format')
 
@@ -12,7 +12,7 @@ from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from playwright.async_api import async_playwright, Page, Browser, BrowserContext, Playwright
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +21,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+BROWSER_ARGS = ['--no-sandbox', '--disable-dev-shm-usage']
+
+
+async def launch_browser() -> Tuple[Playwright, Browser]:
+    """Start Playwright and launch a headless Chromium that scrapers can share"""
+    playwright = await async_playwright().start()
+    browser = await playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+    return playwright, browser
+
 
 @dataclass
 class LienRecord:
@@ -51,8 +60,11 @@ class NYCACRISAutomation:
     BASE_URL = "https://a836-acris.nyc.gov/CP/"
     SEARCH_URL = "https://a836-acris.nyc.gov/CP/TitleSearch/DocumentTypeSearch"
     
-    def __init__(self):
-        self.browser: Optional[Browser] = None
+    def __init__(self, browser: Optional[Browser] = None):
+        # A browser passed in is shared: only our own context gets closed
+        self.browser: Optional[Browser] = browser
+        self._owns_browser = browser is None
+        self.playwright: Optional[Playwright] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.records: List[LienRecord] = []
@@ -60,12 +72,8 @@ class NYCACRISAutomation:
     async def initialize(self):
         """Initialize browser with proper config"""
         logger.info("Initializing browser for NYC ACRIS...")
-        playwright = await async_playwright().start()
-        
-        self.browser = await playwright.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-dev-shm-usage']
-        )
+        if self._owns_browser:
+            self.playwright, self.browser = await launch_browser()
         
         self.context = await self.browser.new_context(
             viewport={'width': 1920, 'height': 1080},
@@ -340,15 +348,18 @@ class NYCACRISAutomation:
         logger.info("Closing browser...")
         if self.context:
             await self.context.close()
-        if self.browser:
-            await self.browser.close()
+        if self._owns_browser:
+            if self.browser:
+                await self.browser.close()
+            if self.playwright:
+                await self.playwright.stop()
             
 
 from src.scrapers.ca_sos import scrape_ca_sos_liens
 
-async def scrape_nyc_acris() -> List[LienRecord]:
-    """Entry point for NYC ACRIS scraping"""
-    scraper = NYCACRISAutomation()
+async def scrape_nyc_acris(browser: Optional[Browser] = None) -> List[LienRecord]:
+    """Entry point for NYC ACRIS scraping, optionally on a shared browser"""
+    scraper = NYCACRISAutomation(browser)
     return await scraper.scrape_all_records()
 
 async def scrape_ca_sos(
@@ -368,11 +379,7 @@ async def scrape_ca_sos(
         "Starting CA SOS scraping from %s to %s (max %d records)",
         date_start, date_end, max_records
     )
-    playwright = await async_playwright().start()
-    browser = await playwright.chromium.launch(
-        headless=True,
-        args=['--no-sandbox', '--disable-dev-shm-usage']
-    )
+    playwright, browser = await launch_browser()
     context = await browser.new_context(
         viewport={'width': 1920, 'height': 1080},
         user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
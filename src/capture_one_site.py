@@ -8,12 +8,6 @@ import json
 import sys
 from pathlib import Path
 
-try:
-    from playwright.sync_api import sync_playwright
-except ImportError:
-    print("pip install playwright && playwright install")
-    sys.exit(1)
-
 SITES = {
     "11": ("AZ Maricopa", "https://recorder.maricopa.gov/recording/document-search.html"),
     "13": ("TX Dallas", "https://dallas.tx.publicsearch.us/"),
@@ -21,6 +15,13 @@ SITES = {
 }
 
 def capture_one_site(site_id: str):
+    # Imported here so --list and usage errors don't pay Playwright's import cost
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        print("pip install playwright && playwright install")
+        sys.exit(1)
+
     name, url = SITES[site_id]
     print(f"\n🎯 Opening {name}...")
     
@@ -62,8 +63,12 @@ Document Page:
     print(f"\nNow create a file called '{site_id}_selectors.txt' with your captured selectors.")
 
 if __name__ == "__main__":
+    if len(sys.argv) == 2 and sys.argv[1] in ("--list", "-l"):
+        print("\n".join(f"{k}: {v[0]}" for k, v in SITES.items()))
+        sys.exit(0)
+
     if len(sys.argv) != 2 or sys.argv[1] not in SITES:
-        print("Usage: python capture_one_site.py <site_id>")
+        print("Usage: python capture_one_site.py <site_id | --list>")
         print(f"  Sites: {', '.join(SITES.keys())}")
         sys.exit(1)
     
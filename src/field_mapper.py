@@ -102,7 +102,7 @@ class FieldMapper:
 
     def map_record(self, extracted_fields: Dict[str, str], raw_text: str) -> MappedRecord:
         """Map extracted fields to standardized record"""
-        logger.info(f"Mapping record for site {self.site_key}")
+        logger.info("Mapping record for site %s", self.site_key)
 
         # Map each field with confidence scoring
         record = MappedRecord(
@@ -186,7 +186,7 @@ class FieldMapper:
                 return f"{month.zfill(2)}/{day.zfill(2)}/{year}"
 
         except Exception as e:
-            logger.warning(f"Date normalization failed: {e}")
+            logger.warning("Date normalization failed: %s", e)
 
         return date_str
 
@@ -3,19 +3,94 @@ PDF Extractor Module
 Handles multi-page PDF downloads and text extraction with OCR fallback
 """
 import io
+import os
+import asyncio
 import re
+import hashlib
+import tempfile
+import contextlib
+import functools
 import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import fitz  # PyMuPDF
 from PIL import Image
 import pytesseract
 
+try:
+    # Optional: in-process Tesseract, no tesseract fork/exec per image
+    from tesserocr import PyTessBaseAPI, OEM
+except ImportError:
+    PyTessBaseAPI = None
+
 logger = logging.getLogger(__name__)
 
+# Connection pool sizing for PDF downloads: up to SITE_CONCURRENCY sites x
+# DOWNLOAD_CONCURRENCY downloads share one session, mostly against one host
+HTTP_POOL_MAXSIZE = 32
+
+
+def _build_session() -> requests.Session:
+    """Session with a pooled adapter that retries transient gateway errors"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Lien PDFs are a few MB at most; anything larger is a runaway download
+MAX_PDF_BYTES = 50_000_000
+
+
+def _check_pdf_size(response) -> None:
+    """Fail fast when the server announces an oversized body (requests or aiohttp)"""
+    length = int(response.headers.get("Content-Length") or 0)
+    if length > MAX_PDF_BYTES:
+        raise RuntimeError(f"PDF too large ({length} bytes)")
+
+
+# Tesseract options for rendered pages (page segmentation left at the
+# automatic default: lien forms are multi-box layouts)
+OCR_CONFIG = "--oem 1"
+
+
+# Serializes PyMuPDF (not thread-safe) across the threads of one process
+_fitz_lock = threading.Lock()
+
+
+# One tesserocr API per thread (instances are not thread-safe); spawned
+# pool workers get their own through their own module import
+_tess_local = threading.local()
+
+
+def _image_to_string(img, config: str = OCR_CONFIG) -> str:
+    """OCR a PIL image, in-process via tesserocr when it is installed"""
+    if PyTessBaseAPI is None:
+        return pytesseract.image_to_string(img, config=config)
+    api = getattr(_tess_local, "api", None)
+    if api is None:
+        api = _tess_local.api = PyTessBaseAPI(oem=OEM.LSTM_ONLY)
+    api.SetImage(img)
+    return api.GetUTF8Text()
+
 
 @dataclass
 class PDFPage:
@@ -38,64 +113,273 @@ class ExtractedPDF:
 class PDFExtractor:
     """Extract text from PDFs with OCR fallback for scanned documents"""
 
-    def __init__(self, temp_dir: str = "/tmp/lien_pdfs"):
+    def __init__(self, temp_dir: str = "/tmp/lien_pdfs",
+                 session: Optional[requests.Session] = None,
+                 processes: int = 0,
+                 extract_images: bool = False,
+                 ocr_threads: int = 1,
+                 cache_bytes: int = 0):
         self.temp_dir = Path(temp_dir)
         self.temp_dir.mkdir(exist_ok=True)
+        # Fetched PDFs are kept in temp_dir (memory-backed on Cloud Functions)
+        # only when cache_bytes > 0, evicting the least recently used files
+        # once their total passes it
+        self.cache_bytes = cache_bytes
+        self._cache_lock = threading.Lock()
+        # Embedded images of scanned pages (and the OCR fallback over them)
+        # are only pulled out on request; scanned pages are already OCR'd
+        # once from the rendered page
+        self.extract_images = extract_images
+        # Scanned pages of one document are OCR'd this many at a time
+        # (pytesseract runs tesseract as a subprocess, so threads suffice).
+        # The executor is kept for the extractor's lifetime so its threads,
+        # and their tesserocr APIs, are reused across documents.
+        self.ocr_threads = ocr_threads
+        self._ocr_executor: Optional[ThreadPoolExecutor] = None
+        if ocr_threads > 1 or processes > 1:
+            # Concurrent OCR: keep each tesseract to one OpenMP thread rather
+            # than oversubscribing the cores (inherited by the tesseract
+            # subprocesses, by spawned pool workers and by tesserocr, which
+            # reads it at init). An explicit setting wins.
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+        if ocr_threads > 1:
+            self._ocr_executor = ThreadPoolExecutor(
+                max_workers=ocr_threads, thread_name_prefix="ocr"
+            )
+        # Pooled session: downloads from the same host reuse TCP/TLS connections
+        self.session = session or _build_session()
+        # With processes > 1, text/OCR extraction (CPU-bound, holds the GIL)
+        # runs in a process pool so concurrent documents use every core
+        # (spawned rather than forked: callers run on worker threads, and
+        # forking a threaded process can deadlock the child)
+        self.processes = processes
+        self._pool_lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        if processes > 1:
+            self._pool = self._new_pool()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        """Spawn-context pool of self.processes extraction workers"""
+        return ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _replace_broken_pool(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """Swap in a fresh pool for one whose worker died (once, however many callers saw it)"""
+        with self._pool_lock:
+            if self._pool is broken:
+                logger.warning("PDF process pool broke (worker died), restarting it")
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._pool = self._new_pool()
+            return self._pool
+
+    @staticmethod
+    def cache_filename(url: str) -> str:
+        """Stable per-URL filename (hash() is salted per process)"""
+        return f"lien_{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}.pdf"
+
+    def _cached_path(self, filepath: Path) -> Optional[Path]:
+        """Return filepath if a complete earlier download is on disk"""
+        try:
+            if filepath.stat().st_size > 0:
+                return filepath
+        except OSError:
+            pass
+        return None
+
+    def _write_file(self, filepath: Path, chunks) -> None:
+        """Write chunks to filepath through a unique temp file and a rename,
+        so concurrent writers and interrupted downloads never leave a torn file"""
+        tmp = tempfile.NamedTemporaryFile(
+            dir=self.temp_dir, prefix=f"{filepath.name}.", suffix=".part",
+            delete=False, buffering=0,
+        )
+        try:
+            with tmp:
+                for chunk in chunks:
+                    tmp.write(chunk)
+            os.replace(tmp.name, filepath)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp.name)
+            raise
+
+    def _evict_cache(self) -> None:
+        """Drop least recently used cached PDFs beyond cache_bytes"""
+        with self._cache_lock:
+            entries = []
+            for path in self.temp_dir.glob("lien_*.pdf"):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+
+            total = 0
+            for _, size, path in sorted(entries, reverse=True):
+                total += size
+                if total > self.cache_bytes:
+                    with contextlib.suppress(OSError):
+                        path.unlink()
 
     def download_pdf(self, url: str, filename: Optional[str] = None) -> str:
-        """Download PDF from URL to temp location"""
+        """Download PDF from URL to temp location (reused if cached)"""
         if not filename:
-            filename = f"lien_{hash(url)}.pdf"
+            filename = self.cache_filename(url)
 
         filepath = self.temp_dir / filename
+        if self.cache_bytes > 0 and self._cached_path(filepath):
+            logger.info("Using cached PDF %s", filepath)
+            return str(filepath)
 
         try:
-            logger.info(f"Downloading PDF from {url}")
-            response = requests.get(url, timeout=30, stream=True)
-            response.raise_for_status()
+            logger.info("Downloading PDF from %s", url)
+            # Context-managed so the connection goes back to the pool on errors
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                _check_pdf_size(response)
+                self._write_file(filepath, response.iter_content(chunk_size=1 << 20))
+
+            logger.info("PDF saved to %s", filepath)
+            return str(filepath)
+
+        except Exception as e:
+            logger.error("Failed to download PDF: %s", e)
+            raise
 
-            with open(filepath, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+    def _read_cached(self, url: str) -> Optional[bytes]:
+        """Bytes of an earlier download of url, if caching is on and it is cached"""
+        if self.cache_bytes <= 0:
+            return None
+        filepath = self.temp_dir / self.cache_filename(url)
+        if not self._cached_path(filepath):
+            return None
+        try:
+            os.utime(filepath)  # mark as recently used
+            data = filepath.read_bytes()
+        except OSError:
+            # Evicted between the check and the read
+            return None
+        logger.info("Using cached PDF %s", filepath)
+        return data
+
+    def _store_cached(self, url: str, data: bytes) -> None:
+        """Cache downloaded bytes on disk when caching is on (best-effort)"""
+        if self.cache_bytes <= 0 or len(data) > self.cache_bytes:
+            return
+        filepath = self.temp_dir / self.cache_filename(url)
+        try:
+            self._write_file(filepath, (data,))
+            self._evict_cache()
+        except OSError as e:
+            # Caching is best-effort; the bytes are still usable
+            logger.warning("Could not cache PDF %s: %s", filepath, e)
+
+    def fetch_pdf(self, url: str) -> bytes:
+        """Download PDF from URL into memory (via the on-disk cache, if enabled)"""
+        data = self._read_cached(url)
+        if data is not None:
+            return data
 
-            logger.info(f"PDF saved to {filepath}")
-            return str(filepath)
+        try:
+            logger.info("Downloading PDF from %s", url)
+            # Streamed only so the size check runs before the body is read
+            with self.session.get(url, timeout=30, stream=True) as response:
+                response.raise_for_status()
+                _check_pdf_size(response)
+                data = response.content
 
         except Exception as e:
-            logger.error(f"Failed to download PDF: {e}")
+            logger.error("Failed to download PDF: %s", e)
             raise
 
+        self._store_cached(url, data)
+        return data
+
+    async def fetch_pdf_async(self, session, url: str) -> bytes:
+        """fetch_pdf on an aiohttp.ClientSession, without blocking the loop"""
+        # Cache file I/O (up to MAX_PDF_BYTES) runs off the event loop
+        data = await asyncio.to_thread(self._read_cached, url)
+        if data is not None:
+            return data
+
+        try:
+            logger.info("Downloading PDF from %s", url)
+            async with session.get(url) as response:
+                response.raise_for_status()
+                _check_pdf_size(response)
+                data = await response.read()
+
+        except Exception as e:
+            logger.error("Failed to download PDF: %s", e)
+            raise
+
+        await asyncio.to_thread(self._store_cached, url, data)
+        return data
+
     def extract_text(self, pdf_path: str) -> ExtractedPDF:
         """Extract text from all pages of PDF"""
-        logger.info(f"Extracting text from {pdf_path}")
+        logger.info("Extracting text from %s", pdf_path)
+        return self._extract_document(Path(pdf_path).name, filename=pdf_path)
 
+    def extract_from_bytes(self, data: bytes, filename: str = "document.pdf") -> ExtractedPDF:
+        """Extract text from an in-memory PDF (no temp file round-trip)"""
+        logger.info("Extracting text from %s (%s bytes)", filename, len(data))
+        return self._extract_document(filename, stream=data, filetype="pdf")
+
+    def _extract_document(self, name: str, **open_args) -> ExtractedPDF:
+        """Extract pages of a PDF opened with fitz.open(**open_args)"""
         try:
-            doc = fitz.open(pdf_path)
             pages: List[PDFPage] = []
             all_text_parts: List[str] = []
             is_searchable = False
 
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-
-                # Try to get text directly (for searchable PDFs)
-                text = page.get_text()
-
-                if text.strip():
-                    is_searchable = True
-                    logger.debug(
-                        f"Page {page_num + 1}: Extracted {len(text)} chars via text extraction"
-                    )
-                else:
-                    # PDF is scanned image - use OCR
-                    logger.info(
-                        f"Page {page_num + 1}: No searchable text, using OCR"
+            # First pass (serial, PyMuPDF is not thread-safe): text layer,
+            # page renders for OCR and embedded images. Without a pool, records'
+            # threads extract concurrently, so the pass holds the fitz lock.
+            texts: List[str] = []
+            page_images: List[List[bytes]] = []
+            ocr_pages: List[int] = []
+            renders: List[Optional[Image.Image]] = []
+            with _fitz_lock:
+                doc = fitz.open(**open_args)
+                for page_num in range(len(doc)):
+                    page = doc[page_num]
+
+                    # Try to get text directly (for searchable PDFs)
+                    text = page.get_text()
+
+                    if text.strip():
+                        is_searchable = True
+                        logger.debug(
+                            "Page %s: Extracted %s chars via text extraction",
+                            page_num + 1, len(text)
+                        )
+                    else:
+                        # PDF is scanned image - use OCR
+                        logger.info(
+                            "Page %s: No searchable text, using OCR", page_num + 1
+                        )
+                        ocr_pages.append(page_num)
+                        renders.append(self._render_page(page))
+                    texts.append(text)
+
+                    # Extract images of scanned pages for the OCR fallback below;
+                    # searchable pages never need them
+                    page_images.append(
+                        self._extract_images(page)
+                        if self.extract_images and not text.strip() else []
                     )
-                    text = self._ocr_page(page)
 
-                # Extract images for potential additional processing
-                images = self._extract_images(page)
+                doc.close()
+
+            # OCR the rendered pages, in parallel when several need it
+            ocr_results = self._map_ocr(self._ocr_image, renders)
+            for page_num, text in zip(ocr_pages, ocr_results):
+                texts[page_num] = text
 
+            for page_num, (text, images) in enumerate(zip(texts, page_images)):
                 # Try OCR on images as additional source
                 ocr_text = None
                 if images and not text.strip():
@@ -113,44 +397,52 @@ class PDFExtractor:
                 if ocr_text:
                     all_text_parts.append(ocr_text)
 
-            doc.close()
-
             all_text = "\n\n".join(all_text_parts)
 
             result = ExtractedPDF(
-                filename=Path(pdf_path).name,
+                filename=name,
                 pages=pages,
                 all_text=all_text,
                 is_searchable=is_searchable,
             )
 
             logger.info(
-                f"Extracted {len(pages)} pages, total {len(all_text)} chars"
+                "Extracted %s pages, total %s chars", len(pages), len(all_text)
             )
             return result
 
         except Exception as e:
-            logger.error(f"PDF extraction failed: {e}")
+            logger.error("PDF extraction failed: %s", e)
             raise
 
-    def _ocr_page(self, page) -> str:
-        """OCR a PDF page using PyMuPDF -> PIL -> Tesseract"""
+    def _render_page(self, page) -> Optional[Image.Image]:
+        """Render a PDF page for OCR using PyMuPDF -> PIL"""
         try:
-            # Render page as image (2x zoom for better OCR)
-            pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))
-            img_data = pix.tobytes("png")
+            # Render page as greyscale image (2x zoom, ~144 DPI, for better OCR)
+            pix = page.get_pixmap(
+                matrix=fitz.Matrix(2, 2), colorspace=fitz.csGRAY, alpha=False
+            )
 
-            # Convert to PIL Image
-            img = Image.open(io.BytesIO(img_data))
+            # Wrap the raw samples as a PIL Image (no PNG encode/decode)
+            return Image.frombytes("L", (pix.width, pix.height), pix.samples)
 
-            # OCR with Tesseract
-            text = pytesseract.image_to_string(img)
+        except Exception as e:
+            logger.error("Page render failed: %s", e)
+            return None
 
-            logger.debug(f"OCR extracted {len(text)} chars")
+    def _ocr_image(self, img: Optional[Image.Image]) -> str:
+        """OCR a rendered page with Tesseract"""
+        if img is None:
+            return ""
+        try:
+            # OCR with Tesseract (LSTM engine)
+            text = _image_to_string(img)
+
+            logger.debug("OCR extracted %s chars", len(text))
             return text
 
         except Exception as e:
-            logger.error(f"OCR failed: {e}")
+            logger.error("OCR failed: %s", e)
             return ""
 
     def _extract_images(self, page) -> List[bytes]:
@@ -164,25 +456,59 @@ class PDFExtractor:
                 image_bytes = base_image["image"]
                 images.append(image_bytes)
         except Exception as e:
-            logger.warning(f"Image extraction failed: {e}")
+            logger.warning("Image extraction failed: %s", e)
         return images
 
+    def _map_ocr(self, ocr, items: list) -> list:
+        """Apply an OCR function to items in order, ocr_threads at a time"""
+        if self._ocr_executor is not None and len(items) > 1:
+            return list(self._ocr_executor.map(ocr, items))
+        return [ocr(item) for item in items]
+
     def _ocr_images(self, images: List[bytes]) -> str:
         """OCR list of image bytes"""
-        texts: List[str] = []
-        for img_bytes in images:
-            try:
-                img = Image.open(io.BytesIO(img_bytes))
-                text = pytesseract.image_to_string(img)
-                texts.append(text)
-            except Exception as e:
-                logger.warning(f"Image OCR failed: {e}")
-        return "\n".join(texts)
+        texts = self._map_ocr(self._ocr_image_bytes, images)
+        return "\n".join(text for text in texts if text is not None)
+
+    def _ocr_image_bytes(self, img_bytes: bytes) -> Optional[str]:
+        """OCR one embedded image (None if it could not be read)"""
+        try:
+            img = Image.open(io.BytesIO(img_bytes))
+            return _image_to_string(img, config="")
+        except Exception as e:
+            logger.warning("Image OCR failed: %s", e)
+            return None
 
     def extract_from_url(self, url: str) -> ExtractedPDF:
-        """Download and extract PDF in one step"""
-        pdf_path = self.download_pdf(url)
-        return self.extract_text(pdf_path)
+        """Download and extract PDF in one step (in memory, no temp file)"""
+        return self.extract_downloaded(url, self.fetch_pdf(url))
+
+    def extract_downloaded(self, url: str, data: bytes) -> ExtractedPDF:
+        """Extract a PDF already fetched from url (in the pool if there is one)"""
+        filename = self.cache_filename(url)
+        pool = self._pool
+        if pool is not None:
+            args = (_extract_bytes_in_worker, data, filename, self.extract_images)
+            try:
+                return pool.submit(*args).result()
+            except BrokenProcessPool:
+                # A worker was killed (e.g. OOM): rebuild the pool and retry once
+                # rather than failing every later record on this warm instance
+                return self._replace_broken_pool(pool).submit(*args).result()
+        return self.extract_from_bytes(data, filename)
+
+
+# Per-process extractor for pool workers (created on first task)
+_worker_extractor: Optional[PDFExtractor] = None
+
+
+def _extract_bytes_in_worker(data: bytes, filename: str,
+                             extract_images: bool = False) -> ExtractedPDF:
+    """Extract a downloaded PDF with an extractor reused per worker process"""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = PDFExtractor(extract_images=extract_images)
+    return _worker_extractor.extract_from_bytes(data, filename)
 
 
 class FieldExtractor:
@@ -193,39 +519,54 @@ class FieldExtractor:
     LastName, Street, City, State, Zip).
     """
 
-    # Regex helpers
+    # Regex helpers (compiled once at class load; all matched case-insensitively)
     AMOUNT_PATTERNS = [
-        # Per mapping guide: amount shown as "Total" on the doc
-        r"TOTAL\s*[:\-]?\s*\$?([\d,]+\.?\d{0,2})",
-        r"AMOUNT\s*[:\-]?\s*\$?([\d,]+\.?\d{0,2})",
-        r"LIEN\s+AMOUNT\s*[:\-]?\s*\$?([\d,]+\.?\d{0,2})",
-        # Fallback generic dollar amount
-        r"\$?([\d,]+\.\d{2})",
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            # Per mapping guide: amount shown as "Total" on the doc
+            r"TOTAL\s*[:\-]?\s*\$?([\d,]+\.?\d{0,2})",
+            r"AMOUNT\s*[:\-]?\s*\$?([\d,]+\.?\d{0,2})",
+            r"LIEN\s+AMOUNT\s*[:\-]?\s*\$?([\d,]+\.?\d{0,2})",
+            # Fallback generic dollar amount
+            r"\$?([\d,]+\.\d{2})",
+        )
     ]
 
     TAXPAYER_NAME_PATTERNS = [
-        # Use double-quoted raw strings - avoid quotes in char class
-        r"NAME\s+OF\s+TAXPAYER\s*[:\-]?\s*([\w\s\-.]+)",
-        r"TAXPAYER\s*[:\-]?\s*([\w\s\-.]+)",
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            # Use double-quoted raw strings - avoid quotes in char class
+            r"NAME\s+OF\s+TAXPAYER\s*[:\-]?\s*([\w\s\-.]+)",
+            r"TAXPAYER\s*[:\-]?\s*([\w\s\-.]+)",
+        )
     ]
 
-    ADDRESS_PATTERN = (
+    ADDRESS_PATTERN = re.compile(
         r"(\d+\s+[\w\s]+"
         r"(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct|"
-        r"Plaza|Plz|Suite|Ste|Floor|Fl)\.?)"
+        r"Plaza|Plz|Suite|Ste|Floor|Fl)\.?)",
+        re.IGNORECASE,
     )
 
-    CITY_STATE_ZIP_PATTERN = (
-        r"([A-Za-z\s]+),?\s*([A-Z]{2})\s*(\d{5}(?:-\d{4})?)"
+    CITY_STATE_ZIP_PATTERN = re.compile(
+        r"([A-Za-z\s]+),?\s*([A-Z]{2})\s*(\d{5}(?:-\d{4})?)",
+        re.IGNORECASE,
     )
 
     # Fallback text-based lien date (used only when no recorder/results-table date)
     LIEN_DATE_TEXT_PATTERNS = [
-        r"DATE\s+OF\s+LIEN\s*[:\-]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-        r"LIEN\s+DATE\s*[:\-]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-        r"FILED\s*[:\-]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"DATE\s+OF\s+LIEN\s*[:\-]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+            r"LIEN\s+DATE\s*[:\-]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+            r"FILED\s*[:\-]?\s*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+        )
     ]
 
+    # Optional SSN / EIN patterns (case-sensitive)
+    SSN_PATTERN = re.compile(r"(\d{3}-\d{2}-\d{4}|XXX-XX-\d{4})")
+    EIN_PATTERN = re.compile(r"(\d{2}-\d{7})")
+
     BUSINESS_KEYWORDS = [
         " INC",
         " LLC",
@@ -241,11 +582,37 @@ class FieldExtractor:
         " PC ",
         " PLLC",
     ]
+    # All keywords in one pass (same substring semantics as the list)
+    BUSINESS_KEYWORDS_RE = re.compile("|".join(map(re.escape, BUSINESS_KEYWORDS)))
+
+    # Document-level markers, matched case-insensitively so the full text
+    # never has to be upper-cased
+    RELEASE_TITLE_RE = re.compile(
+        r"CERTIFICATE OF RELEASE|RELEASE OF FEDERAL TAX LIEN", re.IGNORECASE
+    )
+    LIEN_TITLE_RE = re.compile(
+        r"NOTICE OF FEDERAL TAX LIEN|FEDERAL TAX LIEN", re.IGNORECASE
+    )
+    FORM_941_RE = re.compile(r" 941|FORM 941", re.IGNORECASE)
+
+    def scan_common_fields(self, pdf_text: str) -> tuple:
+        """
+        Run the amount / taxpayer name / address scans of a document.
+
+        Returns (amount, taxpayer_name_raw, address components); pass it as
+        ``scan`` to build_export_row / extract_raw_fields so callers using
+        both scan each document once.
+        """
+        return (
+            self.extract_amount(pdf_text),
+            self.extract_taxpayer_name_raw(pdf_text),
+            self.extract_address_components(pdf_text),
+        )
 
     def extract_amount(self, pdf_text: str) -> Optional[str]:
         """Extract the Total amount per mapping guide."""
         for pattern in self.AMOUNT_PATTERNS:
-            match = re.search(pattern, pdf_text, flags=re.IGNORECASE)
+            match = pattern.search(pdf_text)
             if match:
                 value = match.group(1).replace(",", "").strip()
                 return value
@@ -254,7 +621,7 @@ class FieldExtractor:
     def extract_taxpayer_name_raw(self, pdf_text: str) -> Optional[str]:
         """Extract raw Name of Taxpayer string."""
         for pattern in self.TAXPAYER_NAME_PATTERNS:
-            match = re.search(pattern, pdf_text, flags=re.IGNORECASE)
+            match = pattern.search(pdf_text)
             if match:
                 return match.group(1).strip()
         return None
@@ -268,13 +635,11 @@ class FieldExtractor:
         state = None
         zip5 = None
 
-        street_match = re.search(self.ADDRESS_PATTERN, pdf_text, flags=re.IGNORECASE)
+        street_match = self.ADDRESS_PATTERN.search(pdf_text)
         if street_match:
             street = street_match.group(1).strip()
 
-        csz_match = re.search(
-            self.CITY_STATE_ZIP_PATTERN, pdf_text, flags=re.IGNORECASE
-        )
+        csz_match = self.CITY_STATE_ZIP_PATTERN.search(pdf_text)
         if csz_match:
             city = csz_match.group(1).strip()
             state = csz_match.group(2).strip()
@@ -296,11 +661,9 @@ class FieldExtractor:
         - Look for "Certificate of Release", "Release of Federal Tax Lien" → Release
         - Look for "Notice of Federal Tax Lien" → Lien
         """
-        text_upper = pdf_text.upper()
-
-        if "CERTIFICATE OF RELEASE" in text_upper or "RELEASE OF FEDERAL TAX LIEN" in text_upper:
+        if self.RELEASE_TITLE_RE.search(pdf_text):
             return "Release"
-        if "NOTICE OF FEDERAL TAX LIEN" in text_upper or "FEDERAL TAX LIEN" in text_upper:
+        if self.LIEN_TITLE_RE.search(pdf_text):
             return "Lien"
 
         return None
@@ -315,7 +678,7 @@ class FieldExtractor:
 
         # If it contains typical business keywords, don't treat as a pure person name
         upper_name = " " + name.upper() + " "
-        if any(kw in upper_name for kw in self.BUSINESS_KEYWORDS):
+        if self.BUSINESS_KEYWORDS_RE.search(upper_name):
             return False
 
         # Basic capitalization heuristic
@@ -342,16 +705,15 @@ class FieldExtractor:
 
         name = " ".join(t for t in taxpayer_name_raw.replace("  ", " ").split())
         upper_name = " " + name.upper() + " "
-        text_upper = pdf_text.upper()
 
         is_business = False
 
         # Keyword-based business hints (INC, LLC, Company, Solutions, etc.)
-        if any(kw in upper_name for kw in self.BUSINESS_KEYWORDS):
+        if self.BUSINESS_KEYWORDS_RE.search(upper_name):
             is_business = True
 
         # Kind of Tax shows 941 is another indicator of Business (per guide)
-        if " 941" in text_upper or "FORM 941" in text_upper:
+        if self.FORM_941_RE.search(pdf_text):
             is_business = True
 
         looks_like_person = self._looks_like_person_name(name)
@@ -408,7 +770,7 @@ class FieldExtractor:
 
         # Fallback: scan text, but try to avoid "PREPARED" or "PREPARER" contexts
         for pattern in self.LIEN_DATE_TEXT_PATTERNS:
-            for match in re.finditer(pattern, pdf_text, flags=re.IGNORECASE):
+            for match in pattern.finditer(pdf_text):
                 span_start = match.start()
                 window_start = max(0, span_start - 80)
                 context = pdf_text[window_start:span_start].upper()
@@ -418,22 +780,22 @@ class FieldExtractor:
 
         return None
 
-    def extract_raw_fields(self, pdf_text: str) -> Dict[str, Any]:
+    def extract_raw_fields(
+        self, pdf_text: str, scan: Optional[tuple] = None
+    ) -> Dict[str, Any]:
         """
         Optional: keep a simple raw-field extraction similar to the original,
         in case callers want the underlying values.
         """
         raw: Dict[str, Any] = {}
 
-        amount = self.extract_amount(pdf_text)
+        amount, taxpayer_name, addr = scan or self.scan_common_fields(pdf_text)
         if amount is not None:
             raw["amount"] = amount
 
-        taxpayer_name = self.extract_taxpayer_name_raw(pdf_text)
         if taxpayer_name is not None:
             raw["taxpayer_name"] = taxpayer_name
 
-        addr = self.extract_address_components(pdf_text)
         raw.update(
             {
                 "address_street": addr.get("Street"),
@@ -444,11 +806,11 @@ class FieldExtractor:
         )
 
         # Optional SSN / EIN patterns (not part of Excel schema but may be useful)
-        ssn_match = re.search(r"(\d{3}-\d{2}-\d{4}|XXX-XX-\d{4})", pdf_text)
+        ssn_match = self.SSN_PATTERN.search(pdf_text)
         if ssn_match:
             raw["ssn"] = ssn_match.group(1)
 
-        ein_match = re.search(r"(\d{2}-\d{7})", pdf_text)
+        ein_match = self.EIN_PATTERN.search(pdf_text)
         if ein_match:
             raw["ein"] = ein_match.group(1)
 
@@ -462,6 +824,7 @@ class FieldExtractor:
         recorder_stamp_date: Optional[str] = None,
         results_table_filing_date: Optional[str] = None,
         lead_source: str = "777",
+        scan: Optional[tuple] = None,
     ) -> Dict[str, Optional[str]]:
         """
         Build a dict that matches the Excel export columns exactly:
@@ -470,9 +833,7 @@ class FieldExtractor:
         LiabilityType, BusinessPersonal, Company, FirstName, LastName,
         Street, City, State, Zip.
         """
-        amount = self.extract_amount(pdf_text)
-        taxpayer_name_raw = self.extract_taxpayer_name_raw(pdf_text)
-        addr = self.extract_address_components(pdf_text)
+        amount, taxpayer_name_raw, addr = scan or self.scan_common_fields(pdf_text)
         lead_type = self.extract_lead_type(pdf_text)
         bp = self.classify_business_personal_and_names(
             taxpayer_name_raw, pdf_text
@@ -503,6 +864,13 @@ class FieldExtractor:
         return export_row
 
 
+@functools.lru_cache(maxsize=1)
+def _get_process_pdf_extractor() -> PDFExtractor:
+    """One extractor for process_pdf calls, so its OCR threads (and their
+    tesserocr engines) are reused instead of leaking one pool per document"""
+    return PDFExtractor(ocr_threads=os.cpu_count() or 1)
+
+
 def process_pdf(
     url: Optional[str] = None,
     local_path: Optional[str] = None,
@@ -536,7 +904,7 @@ def process_pdf(
     lead_source : str
         LeadSource value, defaults to "777" per mapping guide.
     """
-    extractor = PDFExtractor()
+    extractor = _get_process_pdf_extractor()
     field_extractor = FieldExtractor()
 
     if url:
@@ -547,6 +915,8 @@ def process_pdf(
         raise ValueError("Must provide either url or local_path")
 
     pdf_text = pdf_result.all_text
+    # Amount / name / address scans shared by the export row and raw fields
+    scan = field_extractor.scan_common_fields(pdf_text)
 
     export_row = field_extractor.build_export_row(
         pdf_text=pdf_text,
@@ -555,9 +925,10 @@ def process_pdf(
         recorder_stamp_date=recorder_stamp_date,
         results_table_filing_date=results_table_filing_date,
         lead_source=lead_source,
+        scan=scan,
     )
 
-    raw_fields = field_extractor.extract_raw_fields(pdf_text)
+    raw_fields = field_extractor.extract_raw_fields(pdf_text, scan=scan)
 
     return {
         "export_row": export_row,
@@ -65,6 +65,10 @@ _SCRAPER_DISPATCH = {
 # Sheets integration
 # ------------------------------------------------------------------
 
+# Site ID -> FieldMapper site key
+_SITE_KEYS = {"12": "nyc_acris", "10": "cook_county", "20": "ca_sos"}
+
+
 def _write_to_sheets(records: List[Any], site_id: str) -> int:
     """Append records to Google Sheets.  Returns count written."""
     if not records:
@@ -73,12 +77,8 @@ def _write_to_sheets(records: List[Any], site_id: str) -> int:
     from src.sheets_integration import GoogleSheetsIntegration
     from src.field_mapper import FieldMapper
 
-    site_key = {"12": "nyc_acris", "10": "cook_county", "20": "ca_sos"}.get(
-        site_id, "unknown"
-    )
+    site_key = _SITE_KEYS.get(site_id, "unknown")
 
-    mapper = FieldMapper(site_key)
-    rows: List[list] = []
     mapper = FieldMapper(site_key)
     rows: List[list] = []
     for rec in records:
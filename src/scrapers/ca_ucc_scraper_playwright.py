@@ -72,10 +72,12 @@ class CAUCCScraper:
 
     BASE_URL = "https://bizfileonline.sos.ca.gov/search/ucc"
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, browser: Optional[Browser] = None):
         # api_key arg kept for signature compatibility, unused by direct Playwright
         self.playwright: Optional[Playwright] = None
-        self.browser: Optional[Browser] = None
+        # A browser passed in is shared: only our own context gets closed
+        self.browser: Optional[Browser] = browser
+        self._owns_browser = browser is None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
 
@@ -91,9 +93,10 @@ class CAUCCScraper:
         if self.page:
             return
 
-        self.playwright = await async_playwright().start()
-        # Headless by default; set headless=False for local debugging
-        self.browser = await self.playwright.chromium.launch(headless=True)
+        if self._owns_browser:
+            self.playwright = await async_playwright().start()
+            # Headless by default; set headless=False for local debugging
+            self.browser = await self.playwright.chromium.launch(headless=True)
         self.context = await self.browser.new_context(accept_downloads=True)
         self.page = await self.context.new_page()
 
@@ -101,6 +104,8 @@ class CAUCCScraper:
         """Clean up browser resources."""
         if self.context:
             await self.context.close()
+        if not self._owns_browser:
+            return
         if self.browser:
             await self.browser.close()
         if self.playwright:
@@ -188,10 +193,10 @@ class CAUCCScraper:
         """Fills search form and submits."""
         page = self.page
         await page.goto(self.BASE_URL)
-        await page.wait_for_load_state("networkidle")
 
         # 3. Enter dummy search term (required to trigger search?)
         # Spec says: fill 'Internal Revenue Service'
+        # (fill waits for the field itself, no need to wait for network idle)
         await page.get_by_label("Search by name or file number").fill(
             "Internal Revenue Service"
         )
@@ -5,8 +5,11 @@ Handles batch writes, deduplication, and error recovery
 
 import os
 import json
+import hashlib
 import logging
-from typing import List, Dict, Optional, Any
+import threading
+from datetime import datetime
+from typing import List, Dict, Optional, Any, Set, Tuple, Iterator
 from dataclasses import dataclass
 
 import gspread
@@ -22,6 +25,19 @@ SCOPES = [
     'https://www.googleapis.com/auth/drive'
 ]
 
+# Dedupe key: 64-bit fingerprint of (site_id, amount, company or last_name),
+# or None for short rows. Ints keep the cached key set small on big sheets.
+RecordKey = Optional[int]
+
+# Existing Liens keys per spreadsheet, with the Drive file version they were
+# read at. Warm instances skip re-reading the sheet until its version moves.
+_EXISTING_KEYS_CACHE: Dict[str, Tuple[str, Set[RecordKey]]] = {}
+
+# Rows fetched per ranged read when scanning the Liens tab for keys
+READ_CHUNK_ROWS = 10000
+# Dedupe keys only use columns A..J, so wider columns are never fetched
+KEY_COLUMNS = 10
+
 
 @dataclass
 class SheetWriteResult:
@@ -40,6 +56,8 @@ class GoogleSheetsIntegration:
         self.service_account_info = service_account_info
         self.client = None
         self.sheet = None
+        self.drive = None
+        self._write_lock = threading.Lock()
 
         # Tab names
         self.LIENS_TAB = 'Liens'
@@ -81,12 +99,13 @@ class GoogleSheetsIntegration:
 
             self.client = gspread.authorize(creds)
             self.sheet = self.client.open_by_key(self.sheet_id)
+            self.drive = build('drive', 'v3', credentials=creds, cache_discovery=False)
 
             logger.info("Successfully authenticated with Google Sheets")
             return True
 
         except Exception as e:
-            logger.error(f"Authentication failed: {e}")
+            logger.error("Authentication failed: %s", e)
             raise
 
     def get_existing_records(self) -> List[List[str]]:
@@ -95,31 +114,85 @@ class GoogleSheetsIntegration:
             worksheet = self.sheet.worksheet(self.LIENS_TAB)
             return worksheet.get_all_values()
         except Exception as e:
-            logger.warning(f"Could not read existing records: {e}")
+            logger.warning("Could not read existing records: %s", e)
             return []
 
-    def check_duplicate(self, new_row: List[Any], existing_records: List[List[str]]) -> bool:
+    def iter_existing_rows(self, chunk_size: int = READ_CHUNK_ROWS) -> Iterator[List[str]]:
+        """Yield existing Liens data rows (header skipped), columns A..J only
+
+        Rows are read in ranged chunks so the whole sheet is never held in
+        memory at once. The API trims trailing blanks, so rows are padded
+        back to the key width as get_all_values would.
+        """
+        worksheet = self.sheet.worksheet(self.LIENS_TAB)
+        last_row = worksheet.row_count
+        last_col = chr(ord('A') + KEY_COLUMNS - 1)
+
+        for start in range(2, last_row + 1, chunk_size):
+            end = min(start + chunk_size - 1, last_row)
+            for row in worksheet.get(f'A{start}:{last_col}{end}'):
+                if len(row) < KEY_COLUMNS:
+                    row = row + [''] * (KEY_COLUMNS - len(row))
+                yield row
+
+    def get_sheet_version(self) -> Optional[str]:
+        """Get the spreadsheet's Drive version (bumped on every change)"""
+        if not self.drive:
+            return None
+        try:
+            meta = self.drive.files().get(fileId=self.sheet_id, fields='version').execute()
+            return meta.get('version')
+        except Exception as e:
+            logger.warning("Could not read sheet version: %s", e)
+            return None
+
+    def get_existing_keys(self) -> Set[RecordKey]:
+        """Get dedupe keys of all existing Liens rows (header skipped)
+
+        Keys are cached per sheet against its Drive version, so an unchanged
+        sheet costs one metadata request instead of a full read.
+        """
+        version = self.get_sheet_version()
+        cached = _EXISTING_KEYS_CACHE.get(self.sheet_id)
+        if version and cached and cached[0] == version:
+            logger.info("Sheet unchanged since last read, reusing existing keys")
+            return cached[1]
+
+        keys: Set[RecordKey] = set()
+        try:
+            for row in self.iter_existing_rows():
+                keys.add(self._create_record_key(row))
+        except Exception as e:
+            logger.warning("Could not read existing records: %s", e)
+            keys.discard(None)
+            return keys
+        keys.discard(None)
+        if version:
+            _EXISTING_KEYS_CACHE[self.sheet_id] = (version, keys)
+        return keys
+
+    def _refresh_cached_keys(self, existing_keys: Set[RecordKey],
+                             written: List[List[Any]]) -> None:
+        """Add written rows' keys to the cached keys and stamp the new version"""
+        cached = _EXISTING_KEYS_CACHE.get(self.sheet_id)
+        version = self.get_sheet_version()
+        if not (version and cached and cached[1] is existing_keys):
+            _EXISTING_KEYS_CACHE.pop(self.sheet_id, None)
+            return
+        existing_keys.update(self._create_record_key(row) for row in written)
+        existing_keys.discard(None)
+        _EXISTING_KEYS_CACHE[self.sheet_id] = (version, existing_keys)
+
+    def check_duplicate(self, new_row: List[Any], existing_keys: Set[RecordKey]) -> bool:
         """Check if record already exists (based on key fields)"""
-        if not existing_records or len(existing_records) < 2:
-            return False
-
-        # Skip header row
-        data_rows = existing_records[1:]
-
         # Create key from site_id + amount + last_name (or company)
         new_key = self._create_record_key(new_row)
+        return new_key is not None and new_key in existing_keys  # Non-empty match
 
-        for existing_row in data_rows:
-            existing_key = self._create_record_key(existing_row)
-            if new_key == existing_key and new_key:  # Non-empty match
-                return True
-
-        return False
-
-    def _create_record_key(self, row: List[Any]) -> str:
+    def _create_record_key(self, row: List[Any]) -> RecordKey:
         """Create unique key for deduplication"""
         if len(row) < 10:
-            return ''
+            return None
 
         site_id = str(row[0] if row[0] else '')
         amount = str(row[2] if row[2] else '')
@@ -129,29 +202,39 @@ class GoogleSheetsIntegration:
         # Use company if present, otherwise last_name
         name_key = company if company else last_name
 
-        return f"{site_id}_{amount}_{name_key}"
+        # Join on the unit separator (absent from sheet values) so fields can't run together
+        digest = hashlib.blake2b(
+            '\x1f'.join((site_id, amount, name_key)).encode(), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, 'little')
 
     def write_liens(self, records: List[List[Any]], verify_first: bool = True) -> SheetWriteResult:
         """Write lien records to Liens tab with deduplication"""
+        # Writers sharing this client (e.g. concurrent sites) go one at a time,
+        # so each dedupes against the others' appends and the cached keys
+        with self._write_lock:
+            return self._write_liens(records, verify_first)
+
+    def _write_liens(self, records: List[List[Any]], verify_first: bool) -> SheetWriteResult:
         try:
             if not self.sheet:
                 self.authenticate()
 
             worksheet = self.sheet.worksheet(self.LIENS_TAB)
 
-            # Get existing records for deduplication
-            existing_records = []
+            # Get existing record keys for deduplication (one pass over the sheet)
+            existing_keys: Set[RecordKey] = set()
             if verify_first:
-                existing_records = self.get_existing_records()
+                existing_keys = self.get_existing_keys()
 
             # Filter duplicates
             new_records = []
             duplicates = 0
 
             for record in records:
-                if self.check_duplicate(record, existing_records):
+                if self.check_duplicate(record, existing_keys):
                     duplicates += 1
-                    logger.info(f"Skipping duplicate record: {record[0:3]}")
+                    logger.info("Skipping duplicate record: %s", record[0:3])
                 else:
                     new_records.append(record)
 
@@ -165,12 +248,19 @@ class GoogleSheetsIntegration:
                 )
 
             # Append new records
-            logger.info(f"Writing {len(new_records)} new records to Liens tab")
+            logger.info("Writing %s new records to Liens tab", len(new_records))
             worksheet.append_rows(new_records, value_input_option='RAW')
 
             # Log to Audit tab
             self._log_audit(f"Added {len(new_records)} liens", len(new_records))
 
+            # The sheet changed: fold our keys into the cached set and re-stamp
+            # it with the post-write version, so the site's next batch skips
+            # the full read. Only a complete, cached read is extended; a row
+            # another writer appends between our append and the version read
+            # is not in the set until the sheet next changes.
+            self._refresh_cached_keys(existing_keys, new_records)
+
             return SheetWriteResult(
                 success=True,
                 rows_written=len(new_records),
@@ -219,24 +309,23 @@ class GoogleSheetsIntegration:
 
             if rows:
                 worksheet.append_rows(rows, value_input_option='RAW')
-                logger.info(f"Wrote {len(rows)} errors to Errors tab")
+                logger.info("Wrote %s errors to Errors tab", len(rows))
 
         except Exception as e:
-            logger.error(f"Failed to write errors: {e}")
+            logger.error("Failed to write errors: %s", e)
 
     def _log_audit(self, action: str, record_count: int):
         """Log action to Audit tab"""
         try:
             worksheet = self.sheet.worksheet(self.AUDIT_TAB)
 
-            from datetime import datetime
             timestamp = datetime.now().isoformat()
 
             row = [timestamp, action, str(record_count)]
             worksheet.append_row(row, value_input_option='RAW')
 
         except Exception as e:
-            logger.warning(f"Could not write audit log: {e}")
+            logger.warning("Could not write audit log: %s", e)
 
     def get_sheet_url(self) -> str:
         """Get URL for the Google Sheet"""